@@ -13,16 +13,40 @@ import re
 import math
 import sys
 import os
-from typing import Dict, List, Tuple, Set, Optional
+from typing import Dict, Iterator, List, Tuple, Set, Optional, TextIO
 from collections import defaultdict
 import argparse
 
 
+# Matches node property lines such as r1[0]="cd1" or pc1[image]="alpine"
+_NODE_RE = re.compile(r'(\w+)\[([^\]]+)\]="?([^"]*)"?')
+
+# Keywords used by Node.classify_node, matched as substrings
+_ROUTER_NAMES = ('router', 'r1', 'r2', 'r3', 'r4', 'r5')
+_PC_NAMES = ('pc', 'host', 'client')
+_SERVER_NAMES = ('server', 'snmp', 'manager', 'zabbix')
+_SWITCH_NAMES = ('switch', 'sw')
+_ROUTER_IMAGES = ('frr', 'quagga', 'bird', 'router')
+_PC_IMAGES = ('alpine', 'ubuntu', 'debian')
+_SERVER_IMAGES = ('server', 'zabbix')
+
+# Stroke colour per connection type; anything else is drawn as a LAN
+_CONNECTION_COLORS = {
+    "ring": "#2196F3",  # Blue
+    "p2p": "#4CAF50",  # Green
+    "lan": "#FF5722",  # Red
+}
+_LAN_COLOR = _CONNECTION_COLORS["lan"]
+
+
 class Node:
     """Represents a network node (router, PC, etc.)"""
     
+    __slots__ = ('name', 'display_name', 'image', 'interfaces', 'properties', 'x', 'y', 'node_type')
+    
     def __init__(self, name: str):
         self.name = name
+        self.display_name = name.upper()  # label drawn on the diagram
         self.image = ""
         self.interfaces = {}  # interface_number -> collision_domain
         self.properties = {}  # bridged, port, network, etc.
@@ -43,24 +67,21 @@ class Node:
         name_lower = self.name.lower()
         image_lower = self.image.lower()
         
-        if any(keyword in name_lower for keyword in ['router', 'r1', 'r2', 'r3', 'r4', 'r5']):
-            if any(keyword in image_lower for keyword in ['frr', 'quagga', 'bird']):
-                self.node_type = "router"
-            else:
-                self.node_type = "router"
-        elif any(keyword in name_lower for keyword in ['pc', 'host', 'client']):
+        if any(keyword in name_lower for keyword in _ROUTER_NAMES):
+            self.node_type = "router"
+        elif any(keyword in name_lower for keyword in _PC_NAMES):
             self.node_type = "pc"
-        elif any(keyword in name_lower for keyword in ['server', 'snmp', 'manager', 'zabbix']):
+        elif any(keyword in name_lower for keyword in _SERVER_NAMES):
             self.node_type = "server"
-        elif any(keyword in name_lower for keyword in ['switch', 'sw']):
+        elif any(keyword in name_lower for keyword in _SWITCH_NAMES):
             self.node_type = "switch"
         else:
             # Try to infer from image
-            if any(keyword in image_lower for keyword in ['frr', 'quagga', 'bird', 'router']):
+            if any(keyword in image_lower for keyword in _ROUTER_IMAGES):
                 self.node_type = "router"
-            elif any(keyword in image_lower for keyword in ['alpine', 'ubuntu', 'debian']):
+            elif any(keyword in image_lower for keyword in _PC_IMAGES):
                 self.node_type = "pc"
-            elif any(keyword in image_lower for keyword in ['server', 'zabbix']):
+            elif any(keyword in image_lower for keyword in _SERVER_IMAGES):
                 self.node_type = "server"
             else:
                 self.node_type = "pc"  # Default
@@ -69,10 +90,17 @@ class Node:
 class Connection:
     """Represents a network connection between nodes"""
     
+    __slots__ = ('collision_domain', 'nodes', 'connection_type', 'router_count',
+                 'has_pc_endpoint', 'hub_x', 'hub_y')
+    
     def __init__(self, collision_domain: str):
         self.collision_domain = collision_domain
         self.nodes = []  # List of (node, interface) tuples
         self.connection_type = "lan"  # lan, p2p, ring
+        self.router_count = 0  # number of router endpoints
+        self.has_pc_endpoint = False  # drawn dashed when a PC is attached
+        self.hub_x = 0.0  # hub position, set after layout for multi-point connections
+        self.hub_y = 0.0
         
     def add_node(self, node: Node, interface: str):
         """Add a node to this connection"""
@@ -80,11 +108,21 @@ class Connection:
         
     def classify_connection(self):
         """Classify connection type"""
+        # Tally endpoint types in a single pass over the nodes
+        router_count = 0
+        has_pc = False
+        for node, _ in self.nodes:
+            if node.node_type == "router":
+                router_count += 1
+            elif node.node_type == "pc":
+                has_pc = True
+        self.router_count = router_count
+        self.has_pc_endpoint = has_pc
+        
         if len(self.nodes) == 2:
             self.connection_type = "p2p"
         elif len(self.nodes) > 2:
             # Check if it's part of a ring topology
-            router_count = sum(1 for node, _ in self.nodes if node.node_type == "router")
             if router_count == 2:
                 self.connection_type = "ring"
             else:
@@ -102,15 +140,15 @@ class KatharaParser:
         
     def parse(self):
         """Parse the lab.conf file"""
+        parse_line = self._parse_line
         with open(self.config_file, 'r') as f:
-            lines = f.readlines()
-            
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            self._parse_line(line)
+            for raw in f:
+                line = raw.strip()
+                # Skip blank lines and comments with a single index check
+                if not line or line[0] == '#':
+                    continue
+                    
+                parse_line(line)
             
         self._classify_nodes_and_connections()
         
@@ -123,7 +161,7 @@ class KatharaParser:
             return
             
         # Node configuration
-        match = re.match(r'(\w+)\[([^\]]+)\]="?([^"]*)"?', line)
+        match = _NODE_RE.match(line)
         if match:
             node_name, property_name, value = match.groups()
             
@@ -168,16 +206,26 @@ class SVGGenerator:
         
     def generate(self) -> str:
         """Generate complete SVG diagram"""
-        self._layout_nodes()
+        return ''.join(self.generate_iter())
         
-        svg = self._create_svg_header()
-        svg += self._create_title()
-        svg += self._draw_connections()
-        svg += self._draw_nodes()
-        svg += self._create_legend()
-        svg += self._create_svg_footer()
+    def write(self, stream: TextIO):
+        """Write the SVG diagram to an open text stream (file, io.StringIO, ...)"""
+        stream.writelines(self.generate_iter())
         
-        return svg
+    def generate_iter(self) -> Iterator[str]:
+        """Generate the SVG diagram as a stream of text fragments
+
+        Lets callers write large diagrams straight to a file without
+        holding the whole document in memory.
+        """
+        self._layout_nodes()
+        
+        yield self._create_svg_header()
+        yield self._create_title()
+        yield from self._draw_connections()
+        yield from self._draw_nodes()
+        yield self._create_legend()
+        yield self._create_svg_footer()
         
     def _layout_nodes(self):
         """Calculate positions for all nodes using improved layout algorithm"""
@@ -190,17 +238,25 @@ class SVGGenerator:
         else:
             self._layout_hierarchical(routers, other_nodes)
             
+        self._place_hubs()
+            
+    def _place_hubs(self):
+        """Position the hub of each multi-point connection at its nodes' centroid"""
+        for connection in self.parser.connections.values():
+            count = len(connection.nodes)
+            if count > 2:
+                members = [node for node, _ in connection.nodes]
+                connection.hub_x = sum([node.x for node in members]) / count
+                connection.hub_y = sum([node.y for node in members]) / count
+                
     def _has_ring_topology(self, routers: List[Node]) -> bool:
         """Check if routers form a ring topology"""
         if len(routers) < 3:
             return False
             
         # Count ring connections between routers
-        ring_connections = 0
-        for connection in self.parser.connections.values():
-            router_nodes = [node for node, _ in connection.nodes if node.node_type == "router"]
-            if len(router_nodes) == 2:
-                ring_connections += 1
+        ring_connections = sum(1 for connection in self.parser.connections.values()
+                               if connection.router_count == 2)
                 
         return ring_connections >= len(routers)
         
@@ -210,24 +266,27 @@ class SVGGenerator:
         center_y = self.height / 2
         ring_radius = min(self.width, self.height) * 0.25
         
-        # Position routers in a circle
+        # Position routers in a circle, keeping each router's outward unit
+        # vector so attached nodes don't need to re-normalise it
+        step = 2 * math.pi / len(routers)
+        outward = {}
         for i, router in enumerate(routers):
-            angle = 2 * math.pi * i / len(routers) - math.pi / 2  # Start at top
-            router.x = center_x + ring_radius * math.cos(angle)
-            router.y = center_y + ring_radius * math.sin(angle)
+            angle = step * i - math.pi / 2  # Start at top
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
+            router.x = center_x + ring_radius * cos_a
+            router.y = center_y + ring_radius * sin_a
+            outward[router.name] = (cos_a, sin_a)
             
         # Position other nodes around their connected routers
-        for node in other_nodes:
-            connected_router = self._find_connected_router(node, routers)
+        node_connections = self._index_connections()
+        router_rank = {router.name: i for i, router in enumerate(routers)}
+        for i, node in enumerate(other_nodes):
+            connected_router = self._find_connected_router(node, node_connections, router_rank)
             if connected_router:
-                # Place node outside the ring
-                dx = connected_router.x - center_x
-                dy = connected_router.y - center_y
-                length = math.sqrt(dx*dx + dy*dy)
-                if length > 0:
-                    # Normalize and extend
-                    dx /= length
-                    dy /= length
+                if ring_radius > 0:
+                    # Place node outside the ring
+                    dx, dy = outward[connected_router.name]
                     node.x = connected_router.x + dx * 100
                     node.y = connected_router.y + dy * 100
                 else:
@@ -235,7 +294,7 @@ class SVGGenerator:
                     node.y = connected_router.y - 100
             else:
                 # Fallback positioning
-                node.x = center_x + (len(other_nodes) - other_nodes.index(node)) * 50
+                node.x = center_x + (len(other_nodes) - i) * 50
                 node.y = center_y + 200
                 
     def _layout_hierarchical(self, routers: List[Node], other_nodes: List[Node]):
@@ -250,23 +309,39 @@ class SVGGenerator:
             node.x = self.margin + (self.width - 2 * self.margin) * (col + 0.5) / cols
             node.y = self.margin + 100 + (self.height - 2 * self.margin - 200) * (row + 0.5) / math.ceil(len(all_nodes) / cols)
             
-    def _find_connected_router(self, node: Node, routers: List[Node]) -> Optional[Node]:
-        """Find which router a node is connected to"""
+    def _index_connections(self) -> Dict[str, List[Connection]]:
+        """Map each node name to the connections it belongs to"""
+        node_connections = defaultdict(list)
         for connection in self.parser.connections.values():
-            nodes_in_connection = [n for n, _ in connection.nodes]
-            if node in nodes_in_connection:
-                for router in routers:
-                    if router in nodes_in_connection:
-                        return router
+            for node, _ in connection.nodes:
+                node_connections[node.name].append(connection)
+        return node_connections
+        
+    def _find_connected_router(self, node: Node, node_connections: Dict[str, List[Connection]],
+                               router_rank: Dict[str, int]) -> Optional[Node]:
+        """Find which router a node is connected to
+
+        node_connections comes from _index_connections and router_rank maps
+        router names to their position in the router list.
+        """
+        for connection in node_connections[node.name]:
+            candidates = [n for n, _ in connection.nodes if n.name in router_rank]
+            if candidates:
+                # Prefer the router that comes first in the router list
+                return min(candidates, key=lambda n: router_rank[n.name])
         return None
         
     def _create_svg_header(self) -> str:
-        """Create SVG header"""
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg viewBox="0 0 {self.width} {self.height}" xmlns="http://www.w3.org/2000/svg">
-  <!-- Background -->
-  <rect width="{self.width}" height="{self.height}" fill="#f8f9fa"/>
-'''
+        """Create SVG header
+
+        The font family is set once on the root element and inherited by
+        every <text>; the black text fill lives on the <g> wrappers around
+        text so it never leaks onto shapes.
+        """
+        return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+                f'<svg viewBox="0 0 {self.width} {self.height}" xmlns="http://www.w3.org/2000/svg" '
+                f'font-family="Arial,sans-serif">\n'
+                f'<rect width="{self.width}" height="{self.height}" fill="#f8f9fa"/>\n')
 
     def _create_svg_footer(self) -> str:
         """Create SVG footer"""
@@ -277,19 +352,20 @@ class SVGGenerator:
         lab_name = self.parser.lab_info.get('LAB_NAME', 'Kathara Network')
         lab_desc = self.parser.lab_info.get('LAB_DESCRIPTION', 'Network Topology')
         
-        return f'''
-  <!-- Title -->
-  <text x="{self.width/2}" y="30" text-anchor="middle" font-family="Arial, sans-serif" font-size="20" font-weight="bold" fill="black">
-    {lab_name}
-  </text>
-  <text x="{self.width/2}" y="50" text-anchor="middle" font-family="Arial, sans-serif" font-size="14" fill="black">
-    {lab_desc}
-  </text>
-'''
+        return (f'<g text-anchor="middle" fill="black">\n'
+                f'<text x="{self.width/2}" y="30" font-size="20" font-weight="bold">{lab_name}</text>\n'
+                f'<text x="{self.width/2}" y="50" font-size="14">{lab_desc}</text>\n'
+                f'</g>\n')
 
-    def _draw_connections(self) -> str:
-        """Draw all network connections"""
-        svg = '\n  <!-- Connections -->\n'
+    def _draw_connections(self) -> Iterator[str]:
+        """Draw all network connections
+
+        Line segments sharing the same stroke are merged into a single
+        <path> so large labs don't emit one <line> element per link.
+        Hubs and labels are drawn after the paths so they sit on top.
+        """
+        segments = defaultdict(list)  # (color, style) -> ["M x1 y1 L x2 y2", ...]
+        overlays = []  # hub circles and labels
         
         for connection in self.parser.connections.values():
             if len(connection.nodes) == 2:
@@ -300,57 +376,48 @@ class SVGGenerator:
                 color = self._get_connection_color(connection)
                 style = self._get_connection_style(connection)
                 
-                svg += f'''  <line x1="{node1.x}" y1="{node1.y}" x2="{node2.x}" y2="{node2.y}" 
-                stroke="{color}" stroke-width="2" {style}/>
-  <text x="{(node1.x + node2.x)/2}" y="{(node1.y + node2.y)/2 - 5}" 
-        text-anchor="middle" font-family="Arial, sans-serif" font-size="10" fill="black">
-    {connection.collision_domain}
-  </text>
-'''
+                segments[(color, style)].append(
+                    f'M{node1.x:.1f} {node1.y:.1f} L{node2.x:.1f} {node2.y:.1f}')
+                overlays.append(f'<text x="{(node1.x + node2.x)/2:.1f}" y="{(node1.y + node2.y)/2 - 5:.1f}">'
+                                f'{connection.collision_domain}</text>\n')
             elif len(connection.nodes) > 2:
-                # Multi-point connection (hub)
-                center_x = sum(node.x for node, _ in connection.nodes) / len(connection.nodes)
-                center_y = sum(node.y for node, _ in connection.nodes) / len(connection.nodes)
-                
-                # Draw hub
-                svg += f'  <circle cx="{center_x}" cy="{center_y}" r="8" fill="#FFC107" stroke="#F57C00" stroke-width="2"/>\n'
+                # Multi-point connection (hub), positioned by _place_hubs
+                cx = f'{connection.hub_x:.1f}'
+                cy = f'{connection.hub_y:.1f}'
                 
                 # Draw connections to hub
                 color = self._get_connection_color(connection)
+                spokes = segments[(color, '')]
                 for node, _ in connection.nodes:
-                    svg += f'  <line x1="{node.x}" y1="{node.y}" x2="{center_x}" y2="{center_y}" stroke="{color}" stroke-width="2"/>\n'
+                    spokes.append(f'M{node.x:.1f} {node.y:.1f} L{cx} {cy}')
                     
-                svg += f'''  <text x="{center_x}" y="{center_y - 15}" text-anchor="middle" 
-        font-family="Arial, sans-serif" font-size="10" fill="black">
-    {connection.collision_domain}
-  </text>
-'''
-        
-        return svg
+                # Draw hub
+                overlays.append(f'<circle cx="{cx}" cy="{cy}" r="8" fill="#FFC107" stroke="#F57C00" stroke-width="2"/>\n')
+                overlays.append(f'<text x="{cx}" y="{connection.hub_y - 15:.1f}">{connection.collision_domain}</text>\n')
+                
+        for (color, style), path in segments.items():
+            yield f'<path d="{" ".join(path)}" fill="none" stroke="{color}" stroke-width="2"{style}/>\n'
+            
+        yield '<g text-anchor="middle" font-size="10" fill="black">\n'
+        yield from overlays
+        yield '</g>\n'
         
     def _get_connection_color(self, connection: Connection) -> str:
         """Get color for connection type"""
-        if connection.connection_type == "ring":
-            return "#2196F3"  # Blue
-        elif connection.connection_type == "p2p":
-            return "#4CAF50"  # Green
-        else:
-            return "#FF5722"  # Red
+        return _CONNECTION_COLORS.get(connection.connection_type, _LAN_COLOR)
             
     def _get_connection_style(self, connection: Connection) -> str:
         """Get style for connection type"""
-        if any(node.node_type == "pc" for node, _ in connection.nodes):
-            return 'stroke-dasharray="5,5"'
-        return ''
+        return ' stroke-dasharray="5,5"' if connection.has_pc_endpoint else ''
         
-    def _draw_nodes(self) -> str:
+    def _draw_nodes(self) -> Iterator[str]:
         """Draw all network nodes"""
-        svg = '\n  <!-- Nodes -->\n'
+        yield '<g text-anchor="middle" fill="black">\n'
         
         for node in self.parser.nodes.values():
-            svg += self._draw_single_node(node)
+            yield self._draw_single_node(node)
             
-        return svg
+        yield '</g>\n'
         
     def _draw_single_node(self, node: Node) -> str:
         """Draw a single node"""
@@ -363,84 +430,54 @@ class SVGGenerator:
             
     def _draw_router(self, node: Node) -> str:
         """Draw a router node"""
-        return f'''  <!-- {node.name} -->
-  <circle cx="{node.x}" cy="{node.y}" r="25" fill="#FF9800" stroke="#E65100" stroke-width="2"/>
-  <text x="{node.x}" y="{node.y + 5}" text-anchor="middle" font-family="Arial, sans-serif" 
-        font-size="11" font-weight="bold" fill="black">
-    {node.name.upper()}
-  </text>
-  <text x="{node.x}" y="{node.y + 35}" text-anchor="middle" font-family="Arial, sans-serif" 
-        font-size="9" fill="black">
-    Router
-  </text>
-'''
+        x = f'{node.x:.1f}'  # formatted once, reused by every element
+        return (f'<circle cx="{x}" cy="{node.y:.1f}" r="25" fill="#FF9800" stroke="#E65100" stroke-width="2"/>\n'
+                f'<text x="{x}" y="{node.y + 5:.1f}" font-size="11" font-weight="bold">{node.display_name}</text>\n'
+                f'<text x="{x}" y="{node.y + 35:.1f}" font-size="9">Router</text>\n')
 
     def _draw_pc(self, node: Node) -> str:
         """Draw a PC node"""
-        return f'''  <!-- {node.name} -->
-  <rect x="{node.x - 25}" y="{node.y - 12}" width="50" height="24" rx="3" 
-        fill="#607D8B" stroke="#37474F" stroke-width="2"/>
-  <text x="{node.x}" y="{node.y + 3}" text-anchor="middle" font-family="Arial, sans-serif" 
-        font-size="10" font-weight="bold" fill="black">
-    {node.name.upper()}
-  </text>
-  <text x="{node.x}" y="{node.y + 35}" text-anchor="middle" font-family="Arial, sans-serif" 
-        font-size="9" fill="black">
-    PC
-  </text>
-'''
+        x = f'{node.x:.1f}'
+        return (f'<rect x="{node.x - 25:.1f}" y="{node.y - 12:.1f}" width="50" height="24" rx="3" '
+                f'fill="#607D8B" stroke="#37474F" stroke-width="2"/>\n'
+                f'<text x="{x}" y="{node.y + 3:.1f}" font-size="10" font-weight="bold">{node.display_name}</text>\n'
+                f'<text x="{x}" y="{node.y + 35:.1f}" font-size="9">PC</text>\n')
 
     def _draw_server(self, node: Node) -> str:
         """Draw a server node"""
         bridged_info = " (Bridged)" if "bridged" in node.properties else ""
-        return f'''  <!-- {node.name} -->
-  <rect x="{node.x - 30}" y="{node.y - 15}" width="60" height="30" rx="3" 
-        fill="#9C27B0" stroke="#6A1B9A" stroke-width="2"/>
-  <text x="{node.x}" y="{node.y + 3}" text-anchor="middle" font-family="Arial, sans-serif" 
-        font-size="9" font-weight="bold" fill="black">
-    {node.name.upper()}
-  </text>
-  <text x="{node.x}" y="{node.y + 35}" text-anchor="middle" font-family="Arial, sans-serif" 
-        font-size="8" fill="black">
-    Server{bridged_info}
-  </text>
-'''
+        x = f'{node.x:.1f}'
+        return (f'<rect x="{node.x - 30:.1f}" y="{node.y - 15:.1f}" width="60" height="30" rx="3" '
+                f'fill="#9C27B0" stroke="#6A1B9A" stroke-width="2"/>\n'
+                f'<text x="{x}" y="{node.y + 3:.1f}" font-size="9" font-weight="bold">{node.display_name}</text>\n'
+                f'<text x="{x}" y="{node.y + 35:.1f}" font-size="8">Server{bridged_info}</text>\n')
 
     def _create_legend(self) -> str:
         """Create diagram legend"""
         legend_x = 50
         legend_y = self.height - 200
         
-        return f'''
-  <!-- Legend -->
-  <g transform="translate({legend_x}, {legend_y})">
-    <text x="0" y="0" font-family="Arial, sans-serif" font-size="16" font-weight="bold" fill="black">Legend:</text>
-    
-    <!-- Router legend -->
-    <circle cx="15" cy="25" r="12" fill="#FF9800" stroke="#E65100" stroke-width="1"/>
-    <text x="35" y="30" font-family="Arial, sans-serif" font-size="12" fill="black">Router</text>
-    
-    <!-- PC legend -->
-    <rect x="5" y="40" width="20" height="12" rx="2" fill="#607D8B" stroke="#37474F" stroke-width="1"/>
-    <text x="35" y="49" font-family="Arial, sans-serif" font-size="12" fill="black">PC/Host</text>
-    
-    <!-- Server legend -->
-    <rect x="5" y="60" width="20" height="12" rx="2" fill="#9C27B0" stroke="#6A1B9A" stroke-width="1"/>
-    <text x="35" y="69" font-family="Arial, sans-serif" font-size="12" fill="black">Server</text>
-    
-    <!-- Ring connection legend -->
-    <line x1="10" y1="85" x2="30" y2="85" stroke="#2196F3" stroke-width="2"/>
-    <text x="35" y="89" font-family="Arial, sans-serif" font-size="12" fill="black">Ring Connection</text>
-    
-    <!-- P2P connection legend -->
-    <line x1="10" y1="105" x2="30" y2="105" stroke="#4CAF50" stroke-width="2" stroke-dasharray="3,3"/>
-    <text x="35" y="109" font-family="Arial, sans-serif" font-size="12" fill="black">LAN Connection</text>
-    
-    <!-- Hub legend -->
-    <circle cx="15" cy="125" r="4" fill="#FFC107" stroke="#F57C00" stroke-width="1"/>
-    <text x="35" y="129" font-family="Arial, sans-serif" font-size="12" fill="black">Network Hub</text>
-  </g>
-'''
+        return (f'<g transform="translate({legend_x},{legend_y})" font-size="12" fill="black">\n'
+                '<text font-size="16" font-weight="bold">Legend:</text>\n'
+                # Router
+                '<circle cx="15" cy="25" r="12" fill="#FF9800" stroke="#E65100"/>\n'
+                '<text x="35" y="30">Router</text>\n'
+                # PC
+                '<rect x="5" y="40" width="20" height="12" rx="2" fill="#607D8B" stroke="#37474F"/>\n'
+                '<text x="35" y="49">PC/Host</text>\n'
+                # Server
+                '<rect x="5" y="60" width="20" height="12" rx="2" fill="#9C27B0" stroke="#6A1B9A"/>\n'
+                '<text x="35" y="69">Server</text>\n'
+                # Ring connection
+                '<path d="M10 85 H30" fill="none" stroke="#2196F3" stroke-width="2"/>\n'
+                '<text x="35" y="89">Ring Connection</text>\n'
+                # LAN connection
+                '<path d="M10 105 H30" fill="none" stroke="#4CAF50" stroke-width="2" stroke-dasharray="3,3"/>\n'
+                '<text x="35" y="109">LAN Connection</text>\n'
+                # Hub
+                '<circle cx="15" cy="125" r="4" fill="#FFC107" stroke="#F57C00"/>\n'
+                '<text x="35" y="129">Network Hub</text>\n'
+                '</g>\n')
 
 
 def main():
@@ -475,11 +512,18 @@ def main():
         # Generate SVG
         print("Generating SVG diagram...")
         svg_generator = SVGGenerator(kathara_parser, args.width, args.height)
-        svg_content = svg_generator.generate()
         
-        # Write output
-        with open(output_file, 'w') as f:
-            f.write(svg_content)
+        # Stream output into a temporary file and only move it into place
+        # once generation succeeds, so a failure never leaves a partial SVG
+        temp_file = f"{output_file}.tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                svg_generator.write(f)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
             
         print(f"SVG diagram saved to: {output_file}")
         